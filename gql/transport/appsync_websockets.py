@@ -4,7 +4,7 @@ from ssl import SSLContext
 from typing import Any, Dict, Optional, Tuple, Union, cast
 from urllib.parse import urlparse
 
-from graphql import DocumentNode, ExecutionResult, print_ast
+from graphql import DocumentNode, ExecutionResult
 
 from .appsync_auth import AppSyncAuthentication, AppSyncIAMAuthentication
 from .exceptions import TransportProtocolError, TransportServerError
@@ -148,7 +148,7 @@ class AppSyncWebsocketsTransport(WebsocketsTransportBase):
 
         self.next_query_id += 1
 
-        data: Dict = {"query": print_ast(document)}
+        data: Dict = {"query": self._get_query_str(document)}
 
         if variable_values:
             data["variables"] = variable_values
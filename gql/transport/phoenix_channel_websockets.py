@@ -3,7 +3,7 @@ import json
 import logging
 from typing import Any, Dict, Optional, Tuple
 
-from graphql import DocumentNode, ExecutionResult, print_ast
+from graphql import DocumentNode, ExecutionResult
 from websockets.exceptions import ConnectionClosed
 
 from .exceptions import (
@@ -104,7 +104,7 @@ class PhoenixChannelWebsocketsTransport(WebsocketsTransportBase):
                 except ConnectionClosed:  # pragma: no cover
                     return
 
-        self.heartbeat_task = asyncio.ensure_future(heartbeat_coro())
+        self.heartbeat_task = self._loop.create_task(heartbeat_coro())
 
     async def _send_stop_message(self, query_id: int) -> None:
         """Send an 'unsubscribe' message to the Phoenix Channel referencing
@@ -175,7 +175,7 @@ class PhoenixChannelWebsocketsTransport(WebsocketsTransportBase):
                 "topic": self.channel_name,
                 "event": "doc",
                 "payload": {
-                    "query": print_ast(document),
+                    "query": self._get_query_str(document),
                     "variables": variable_values or {},
                 },
                 "ref": query_id,
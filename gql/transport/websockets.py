@@ -1,11 +1,11 @@
 import asyncio
-import json
 import logging
+import time
 from contextlib import suppress
 from ssl import SSLContext
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
-from graphql import DocumentNode, ExecutionResult, print_ast
+from graphql import DocumentNode, ExecutionResult
 from websockets.datastructures import HeadersLike
 from websockets.typing import Subprotocol
 
@@ -14,10 +14,41 @@ from .exceptions import (
     TransportQueryError,
     TransportServerError,
 )
-from .websockets_base import WebsocketsTransportBase
+from .websockets_base import (
+    _COMPLETE,
+    WebsocketsTransportBase,
+    _json_dumps,
+    _json_loads,
+)
 
 log = logging.getLogger(__name__)
 
+# Answer types which reference a specific query id, per subprotocol
+_APOLLO_QUERY_ANSWER_TYPES = frozenset({"data", "error", "complete"})
+_GRAPHQLWS_QUERY_ANSWER_TYPES = frozenset({"next", "error", "complete"})
+
+# Control answer types of the graphql-ws subprotocol carrying an optional payload
+_GRAPHQLWS_CONTROL_ANSWER_TYPES = frozenset({"ping", "pong", "connection_ack"})
+
+# Pre-serialized control messages, reused for every payload-less ping/pong
+# so that periodic keepalives don't allocate a dict and re-serialize it
+_PING_MESSAGE = _json_dumps({"type": "ping"})
+_PONG_MESSAGE = _json_dumps({"type": "pong"})
+
+# Pre-parsed answers for the common serializations of the tiny keepalive
+# frames, allowing _parse_answer to skip the JSON parse entirely for them.
+# Unrecognized serializations simply fall through to the full parse.
+_APOLLO_KNOWN_ANSWERS: Dict[str, Tuple[str, None, None]] = {
+    '{"type":"ka"}': ("ka", None, None),
+    '{"type": "ka"}': ("ka", None, None),
+}
+_GRAPHQLWS_KNOWN_ANSWERS: Dict[str, Tuple[str, None, None]] = {
+    '{"type":"ping"}': ("ping", None, None),
+    '{"type": "ping"}': ("ping", None, None),
+    '{"type":"pong"}': ("pong", None, None),
+    '{"type": "pong"}': ("pong", None, None),
+}
+
 
 class WebsocketsTransport(WebsocketsTransportBase):
     """:ref:`Async Transport <async_transports>` used to execute GraphQL queries on
@@ -106,6 +137,12 @@ class WebsocketsTransport(WebsocketsTransportBase):
 
         self.send_ping_task: Optional[asyncio.Future] = None
 
+        self._answer_parser: Callable[
+            [Dict[str, Any]], Tuple[str, Optional[int], Optional[ExecutionResult]]
+        ] = self._parse_answer_apollo
+
+        self._known_answers: Dict[str, Tuple[str, None, None]] = _APOLLO_KNOWN_ANSWERS
+
         self.ping_received: asyncio.Event = asyncio.Event()
         """ping_received is an asyncio Event which will fire  each time
         a ping is received with the graphql-ws protocol"""
@@ -144,7 +181,7 @@ class WebsocketsTransport(WebsocketsTransportBase):
         If the answer is not a connection_ack message, we will return an Exception.
         """
 
-        init_message = json.dumps(
+        init_message = _json_dumps(
             {"type": "connection_init", "payload": self.init_payload}
         )
 
@@ -159,22 +196,18 @@ class WebsocketsTransport(WebsocketsTransportBase):
     async def send_ping(self, payload: Optional[Any] = None) -> None:
         """Send a ping message for the graphql-ws protocol"""
 
-        ping_message = {"type": "ping"}
-
-        if payload is not None:
-            ping_message["payload"] = payload
-
-        await self._send(json.dumps(ping_message))
+        if payload is None:
+            await self._send(_PING_MESSAGE)
+        else:
+            await self._send(_json_dumps({"type": "ping", "payload": payload}))
 
     async def send_pong(self, payload: Optional[Any] = None) -> None:
         """Send a pong message for the graphql-ws protocol"""
 
-        pong_message = {"type": "pong"}
-
-        if payload is not None:
-            pong_message["payload"] = payload
-
-        await self._send(json.dumps(pong_message))
+        if payload is None:
+            await self._send(_PONG_MESSAGE)
+        else:
+            await self._send(_json_dumps({"type": "pong", "payload": payload}))
 
     async def _send_stop_message(self, query_id: int) -> None:
         """Send stop message to the provided websocket connection and query_id.
@@ -182,7 +215,7 @@ class WebsocketsTransport(WebsocketsTransportBase):
         The server should afterwards return a 'complete' message.
         """
 
-        stop_message = json.dumps({"id": str(query_id), "type": "stop"})
+        stop_message = _json_dumps({"id": str(query_id), "type": "stop"})
 
         await self._send(stop_message)
 
@@ -192,7 +225,7 @@ class WebsocketsTransport(WebsocketsTransportBase):
         This is only for the graphql-ws protocol.
         """
 
-        complete_message = json.dumps({"id": str(query_id), "type": "complete"})
+        complete_message = _json_dumps({"id": str(query_id), "type": "complete"})
 
         await self._send(complete_message)
 
@@ -206,11 +239,16 @@ class WebsocketsTransport(WebsocketsTransportBase):
         For graphql-ws: send a "complete" message and simulate the reception
                         of a "complete" message from the backend
         """
-        log.debug(f"stop listener {query_id}")
+        log.debug("stop listener %s", query_id)
 
         if self.subprotocol == self.GRAPHQLWS_SUBPROTOCOL:
             await self._send_complete_message(query_id)
-            await self.listeners[query_id].put(("complete", None))
+
+            # The listener may already be removed if we are running in a
+            # shielded task which outlived the cancelled consumer
+            listener = self.listeners.get(query_id)
+            if listener is not None:
+                await listener.put(_COMPLETE)
         else:
             await self._send_stop_message(query_id)
 
@@ -220,7 +258,7 @@ class WebsocketsTransport(WebsocketsTransportBase):
         This message indicates that the connection will disconnect.
         """
 
-        connection_terminate_message = json.dumps({"type": "connection_terminate"})
+        connection_terminate_message = _json_dumps({"type": "connection_terminate"})
 
         await self._send(connection_terminate_message)
 
@@ -240,7 +278,7 @@ class WebsocketsTransport(WebsocketsTransportBase):
         query_id = self.next_query_id
         self.next_query_id += 1
 
-        payload: Dict[str, Any] = {"query": print_ast(document)}
+        payload: Dict[str, Any] = {"query": self._get_query_str(document)}
         if variable_values:
             payload["variables"] = variable_values
         if operation_name:
@@ -251,7 +289,7 @@ class WebsocketsTransport(WebsocketsTransportBase):
         if self.subprotocol == self.GRAPHQLWS_SUBPROTOCOL:
             query_type = "subscribe"
 
-        query_str = json.dumps(
+        query_str = _json_dumps(
             {"id": str(query_id), "type": query_type, "payload": payload}
         )
 
@@ -292,8 +330,18 @@ class WebsocketsTransport(WebsocketsTransportBase):
         try:
             answer_type = str(json_answer.get("type"))
 
-            if answer_type in ["next", "error", "complete"]:
-                answer_id = int(str(json_answer.get("id")))
+            # Control messages are checked first: on a subscription mostly
+            # idle they are the dominant frame type and need none of the
+            # payload validation done for the query answers
+            if answer_type in _GRAPHQLWS_CONTROL_ANSWER_TYPES:
+                self.payloads[answer_type] = json_answer.get("payload", None)
+
+            elif answer_type in _GRAPHQLWS_QUERY_ANSWER_TYPES:
+                raw_id = json_answer.get("id")
+
+                # Most servers echo the id back as the string we sent, but
+                # accept a raw int directly without the str/int round-trip
+                answer_id = raw_id if isinstance(raw_id, int) else int(str(raw_id))
 
                 if answer_type == "next" or answer_type == "error":
 
@@ -327,14 +375,10 @@ class WebsocketsTransport(WebsocketsTransportBase):
                             str(payload[0]), query_id=answer_id, errors=payload
                         )
 
-            elif answer_type in ["ping", "pong", "connection_ack"]:
-                self.payloads[answer_type] = json_answer.get("payload", None)
-
             else:
                 raise ValueError
 
-            if self.check_keep_alive_task is not None:
-                self._next_keep_alive_message.set()
+            self._last_keep_alive = time.monotonic()
 
         except ValueError as e:
             raise TransportProtocolError(
@@ -363,8 +407,17 @@ class WebsocketsTransport(WebsocketsTransportBase):
         try:
             answer_type = str(json_answer.get("type"))
 
-            if answer_type in ["data", "error", "complete"]:
-                answer_id = int(str(json_answer.get("id")))
+            # Keep-alive messages are checked first since they are the
+            # dominant frame type on a mostly idle subscription
+            if answer_type == "ka":
+                self._last_keep_alive = time.monotonic()
+
+            elif answer_type in _APOLLO_QUERY_ANSWER_TYPES:
+                raw_id = json_answer.get("id")
+
+                # Most servers echo the id back as the string we sent, but
+                # accept a raw int directly without the str/int round-trip
+                answer_id = raw_id if isinstance(raw_id, int) else int(str(raw_id))
 
                 if answer_type == "data" or answer_type == "error":
 
@@ -392,10 +445,6 @@ class WebsocketsTransport(WebsocketsTransportBase):
                             str(payload), query_id=answer_id, errors=[payload]
                         )
 
-            elif answer_type == "ka":
-                # Keep-alive message
-                if self.check_keep_alive_task is not None:
-                    self._next_keep_alive_message.set()
             elif answer_type == "connection_ack":
                 pass
             elif answer_type == "connection_error":
@@ -417,17 +466,30 @@ class WebsocketsTransport(WebsocketsTransportBase):
         """Parse the answer received from the server depending on
         the detected subprotocol.
         """
+
+        # Fast path for the tiny keepalive frames: the length guard keeps
+        # us from hashing large payloads just to miss the lookup
+        if len(answer) < 32:
+            known_answer = self._known_answers.get(answer)
+
+            if known_answer is not None:
+                answer_type = known_answer[0]
+
+                if answer_type != "ka":
+                    self.payloads[answer_type] = None
+
+                self._last_keep_alive = time.monotonic()
+
+                return known_answer
+
         try:
-            json_answer = json.loads(answer)
+            json_answer = _json_loads(answer)
         except ValueError:
             raise TransportProtocolError(
                 f"Server did not return a GraphQL result: {answer}"
             )
 
-        if self.subprotocol == self.GRAPHQLWS_SUBPROTOCOL:
-            return self._parse_answer_graphqlws(json_answer)
-
-        return self._parse_answer_apollo(json_answer)
+        return self._answer_parser(json_answer)
 
     async def _send_ping_coro(self) -> None:
         """Coroutine to periodically send a ping from the client to the backend.
@@ -492,6 +554,16 @@ class WebsocketsTransport(WebsocketsTransportBase):
             # the apollo subprotocol by default
             self.subprotocol = self.APOLLO_SUBPROTOCOL
 
+        # Specialize the parser dispatch once instead of checking the
+        # subprotocol again for every received message: it cannot change
+        # for the lifetime of the connection
+        if self.subprotocol == self.GRAPHQLWS_SUBPROTOCOL:
+            self._answer_parser = self._parse_answer_graphqlws
+            self._known_answers = _GRAPHQLWS_KNOWN_ANSWERS
+        else:
+            self._answer_parser = self._parse_answer_apollo
+            self._known_answers = _APOLLO_KNOWN_ANSWERS
+
         log.debug(f"backend subprotocol returned: {self.subprotocol!r}")
 
     async def _after_initialize(self):
@@ -502,7 +574,7 @@ class WebsocketsTransport(WebsocketsTransportBase):
             and self.ping_interval is not None
         ):
 
-            self.send_ping_task = asyncio.ensure_future(self._send_ping_coro())
+            self.send_ping_task = self._loop.create_task(self._send_ping_coro())
 
     async def _close_hook(self):
 
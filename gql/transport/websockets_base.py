@@ -1,13 +1,27 @@
 import asyncio
+import json
 import logging
+import time
 import warnings
 from abc import abstractmethod
+from collections import deque
 from contextlib import suppress
 from ssl import SSLContext
-from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union, cast
+from typing import (
+    Any,
+    AsyncGenerator,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+from weakref import WeakKeyDictionary
 
 import websockets
-from graphql import DocumentNode, ExecutionResult
+from graphql import DocumentNode, ExecutionResult, print_ast
 from websockets.client import WebSocketClientProtocol
 from websockets.datastructures import Headers, HeadersLike
 from websockets.exceptions import ConnectionClosed
@@ -22,9 +36,49 @@ from .exceptions import (
     TransportServerError,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 log = logging.getLogger("gql.transport.websockets")
 
-ParsedAnswer = Tuple[str, Optional[ExecutionResult]]
+# Sentinel stored in a listener queue when the server sent the "complete"
+# answer for the query. Data answers are stored as bare ExecutionResult
+# objects and errors as Exception instances, so delivering an answer never
+# allocates a wrapper tuple.
+_COMPLETE: Any = object()
+
+# Maximum number of ListenerQueue instances kept for reuse by a transport
+_LISTENER_POOL_SIZE = 32
+
+
+if orjson is not None:
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize the provided object to a JSON string using orjson.
+
+        Falls back to the stdlib json module for the corner cases which
+        orjson does not support (non-str dict keys for example).
+        """
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            return json.dumps(obj, separators=(",", ":"))
+
+    _json_loads = orjson.loads
+
+else:
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize the provided object to a compact JSON string.
+
+        Compact separators save a few percent of wire bytes compared to the
+        stdlib defaults which insert a space after each separator.
+        """
+        return json.dumps(obj, separators=(",", ":"))
+
+    _json_loads = json.loads
 
 
 class ListenerQueue:
@@ -33,22 +87,47 @@ class ListenerQueue:
     If the server is stopped while the listener is still waiting,
     Then we send an exception to the queue and this exception will be raised
     to the consumer once all the previous messages have been consumed from the queue
+
+    The messages are stored in a plain deque fed synchronously by the receive
+    task. The queue has a single producer (the receive task) and a single
+    consumer (the subscribe generator), so the consumer parks on a bare
+    Future which the producer resolves on the empty to non-empty transition;
+    this is the cheapest wakeup primitive asyncio offers (an asyncio.Event
+    allocates the same Future internally plus its own bookkeeping).
+
+    The stored items are bare ExecutionResult objects for data answers,
+    the _COMPLETE sentinel when the server completed the query, or an
+    Exception instance to raise to the consumer.
     """
 
+    __slots__ = ("query_id", "send_stop", "_items", "_waiter", "_closed")
+
     def __init__(self, query_id: int, send_stop: bool) -> None:
         self.query_id: int = query_id
         self.send_stop: bool = send_stop
-        self._queue: asyncio.Queue = asyncio.Queue()
+        self._items: Deque[Any] = deque()
+        self._waiter: Optional[asyncio.Future] = None
         self._closed: bool = False
 
-    async def get(self) -> ParsedAnswer:
+    def reset(self, query_id: int, send_stop: bool) -> None:
+        """Make the instance reusable for a new query.
 
-        try:
-            item = self._queue.get_nowait()
-        except asyncio.QueueEmpty:
-            item = await self._queue.get()
+        Called by the transport listener pool, after the previous consumer
+        is done with the queue.
+        """
+        self.query_id = query_id
+        self.send_stop = send_stop
+        self._items.clear()
+        self._waiter = None
+        self._closed = False
+
+    def _wakeup(self) -> None:
+        waiter = self._waiter
+
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
 
-        self._queue.task_done()
+    def _process_item(self, item: Any) -> Any:
 
         # If we receive an exception when reading the queue, we raise it
         if isinstance(item, Exception):
@@ -57,28 +136,131 @@ class ListenerQueue:
 
         # Don't need to save new answers or
         # send the stop message if we already received the complete message
-        answer_type, execution_result = item
-        if answer_type == "complete":
+        if item is _COMPLETE:
             self.send_stop = False
             self._closed = True
 
         return item
 
-    async def put(self, item: ParsedAnswer) -> None:
+    async def get(self) -> Any:
+
+        while not self._items:
+            waiter: asyncio.Future = asyncio.get_event_loop().create_future()
+            self._waiter = waiter
+            try:
+                await waiter
+            finally:
+                self._waiter = None
+
+        return self._process_item(self._items.popleft())
+
+    def put_nowait(self, item: Any) -> None:
+        """Put the provided item in the queue without yielding to the loop."""
 
         if not self._closed:
-            await self._queue.put(item)
+            self._items.append(item)
+            self._wakeup()
+
+    async def put(self, item: Any) -> None:
+
+        self.put_nowait(item)
+
+    def __aiter__(self) -> "ListenerQueue":
+        return self
+
+    async def __anext__(self) -> ExecutionResult:
+        """Return the next ExecutionResult received for the query.
+
+        Ends the iteration when the server completed the query and raises
+        the stored exception on error frames, so that the consumer loop
+        does not need any branch per answer.
+        """
+
+        if self._items:
+            item = self._process_item(self._items.popleft())
+        else:
+            item = await self.get()
+
+        if item is _COMPLETE:
+            raise StopAsyncIteration
+
+        return item
 
     async def set_exception(self, exception: Exception) -> None:
 
         # Put the exception in the queue
-        await self._queue.put(exception)
+        self._items.append(exception)
+        self._wakeup()
 
         # Don't need to send stop messages in case of error
         self.send_stop = False
         self._closed = True
 
 
+class SingleResultListener:
+    """Single-shot counterpart of ListenerQueue used by execute.
+
+    A query or mutation only ever produces one answer, so buffering is not
+    needed: the receive task resolves a bare Future with the first
+    ExecutionResult (or with None if the server completes without sending
+    data) and the consumer awaits it.
+
+    It exposes the same producer-facing interface as ListenerQueue
+    (send_stop, put_nowait, put, set_exception) so that it can live in the
+    listeners dict next to the subscription queues.
+    """
+
+    __slots__ = ("query_id", "send_stop", "_future")
+
+    def __init__(self, query_id: int) -> None:
+        self.query_id: int = query_id
+
+        # No need to send a stop message: we either received the complete
+        # message or we will leave before the first answer
+        self.send_stop: bool = False
+
+        self._future: asyncio.Future = asyncio.get_event_loop().create_future()
+
+    async def get(self) -> Optional[ExecutionResult]:
+
+        return await self._future
+
+    def put_nowait(self, item: Any) -> None:
+
+        future = self._future
+
+        if future.done():
+            return
+
+        if item is _COMPLETE:
+            future.set_result(None)
+        else:
+            future.set_result(item)
+
+    async def put(self, item: Any) -> None:
+
+        self.put_nowait(item)
+
+    async def set_exception(self, exception: Exception) -> None:
+
+        if not self._future.done():
+            self._future.set_exception(exception)
+
+
+class _SharedSubscription:
+    """State of one de-duplicated wire subscription.
+
+    Holds the broadcast task reading the answers of the single upstream
+    query and the queues of the in-process consumers it fans out to.
+    """
+
+    __slots__ = ("consumers", "task")
+
+    def __init__(self) -> None:
+        self.consumers: List[ListenerQueue] = []
+        self.task: Optional[asyncio.Future] = None
+
+
 class WebsocketsTransportBase(AsyncTransport):
     """abstract :ref:`Async Transport <async_transports>` used to implement
     different websockets protocols.
@@ -130,7 +312,25 @@ class WebsocketsTransportBase(AsyncTransport):
 
         self.websocket: Optional[WebSocketClientProtocol] = None
         self.next_query_id: int = 1
-        self.listeners: Dict[int, ListenerQueue] = {}
+        self.listeners: Dict[int, Union[ListenerQueue, SingleResultListener]] = {}
+
+        self.enable_subscription_sharing: bool = False
+        """Opt-in de-duplication of identical subscriptions.
+
+        When set to True, concurrent calls to subscribe with the same
+        document, variable values and operation name share a single wire
+        subscription, each consumer receiving a copy of every answer.
+        Disabled by default because a consumer joining an already running
+        subscription will not receive the answers sent before it joined.
+        """
+
+        self._shared_subscriptions: Dict[
+            Tuple[str, Optional[str], Optional[str]], _SharedSubscription
+        ] = {}
+
+        self._listener_pool: List[ListenerQueue] = []
+        """Small LIFO pool of ListenerQueue instances, to amortize the
+        allocations on high-frequency subscribe/unsubscribe workloads."""
 
         self.receive_data_task: Optional[asyncio.Future] = None
         self.check_keep_alive_task: Optional[asyncio.Future] = None
@@ -154,14 +354,21 @@ class WebsocketsTransportBase(AsyncTransport):
         self._no_more_listeners: asyncio.Event = asyncio.Event()
         self._no_more_listeners.set()
 
-        if self.keep_alive_timeout is not None:
-            self._next_keep_alive_message: asyncio.Event = asyncio.Event()
-            self._next_keep_alive_message.set()
+        self._last_keep_alive: float = time.monotonic()
+        """Monotonic timestamp of the last sign of liveness from the server.
+
+        Updated with a plain assignment on each received message, which is
+        much cheaper than one asyncio.Event set/clear/wait cycle per message.
+        """
 
         self.payloads: Dict[str, Any] = {}
         """payloads is a dict which will contain the payloads received
         for example with the graphql-ws protocol: 'ping', 'pong', 'connection_ack'"""
 
+        self._print_ast_cache: "WeakKeyDictionary[DocumentNode, str]" = (
+            WeakKeyDictionary()
+        )
+
         self._connecting: bool = False
 
         self.close_exception: Optional[Exception] = None
@@ -215,7 +422,8 @@ class WebsocketsTransportBase(AsyncTransport):
 
         try:
             await self.websocket.send(message)
-            log.info(">>> %s", message)
+            if log.isEnabledFor(logging.INFO):
+                log.info(">>> %s", message)
         except ConnectionClosed as e:
             await self._fail(e, clean_close=False)
             raise e
@@ -237,10 +445,27 @@ class WebsocketsTransportBase(AsyncTransport):
 
         answer: str = data
 
-        log.info("<<< %s", answer)
+        if log.isEnabledFor(logging.INFO):
+            log.info("<<< %s", answer)
 
         return answer
 
+    def _get_query_str(self, document: DocumentNode) -> str:
+        """Return the GraphQL query string for the provided document AST.
+
+        The serialized string is memoized per document so that repeated
+        executions of the same document (reconnections, subscriptions
+        restarted with different variable values) don't pay the print_ast
+        serialization cost each time.
+        """
+        query_str = self._print_ast_cache.get(document)
+
+        if query_str is None:
+            query_str = print_ast(document)
+            self._print_ast_cache[document] = query_str
+
+        return query_str
+
     @abstractmethod
     async def _send_query(
         self,
@@ -261,30 +486,37 @@ class WebsocketsTransportBase(AsyncTransport):
         through keep-alive messages
         """
 
+        assert self.keep_alive_timeout is not None
+
         try:
             while True:
-                await asyncio.wait_for(
-                    self._next_keep_alive_message.wait(), self.keep_alive_timeout
+                # Sleep until the next liveness deadline computed from the
+                # monotonic timestamp of the last received message
+                delay = (
+                    self._last_keep_alive + self.keep_alive_timeout - time.monotonic()
                 )
 
-                # Reset for the next iteration
-                self._next_keep_alive_message.clear()
-
-        except asyncio.TimeoutError:
-            # No keep-alive message in the appriopriate interval, close with error
-            # while trying to notify the server of a proper close (in case
-            # the keep-alive interval of the client or server was not aligned
-            # the connection still remains)
-
-            # If the timeout happens during a close already in progress, do nothing
-            if self.close_task is None:
-                await self._fail(
-                    TransportServerError(
-                        "No keep-alive message has been received within "
-                        "the expected interval ('keep_alive_timeout' parameter)"
-                    ),
-                    clean_close=False,
-                )
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
+
+                # No keep-alive message in the appriopriate interval, close with error
+                # while trying to notify the server of a proper close (in case
+                # the keep-alive interval of the client or server was not aligned
+                # the connection still remains)
+
+                # If the timeout happens during a close already in progress,
+                # do nothing
+                if self.close_task is None:
+                    await self._fail(
+                        TransportServerError(
+                            "No keep-alive message has been received within "
+                            "the expected interval ('keep_alive_timeout' parameter)"
+                        ),
+                        clean_close=False,
+                    )
+
+                break
 
         except asyncio.CancelledError:
             # The client is probably closing, handle it properly
@@ -294,22 +526,28 @@ class WebsocketsTransportBase(AsyncTransport):
         """Main asyncio task which will listen to the incoming messages and will
         call the parse_answer and handle_answer methods of the subclass."""
         try:
+            # Bind the per-message callables to locals once, saving an
+            # attribute lookup per received message in the loop below
+            receive = self._receive
+            parse_answer = self._parse_answer
+            handle_answer = self._handle_answer
+
             while True:
 
-                # Wait the next answer from the websocket server
+                # The exception handlers are hoisted out of the inner loop so
+                # that the per-message path does not pay the handler setup
+                # cost; after a per-query error the outer loop re-enters it
                 try:
-                    answer = await self._receive()
-                except (ConnectionClosed, TransportProtocolError) as e:
-                    await self._fail(e, clean_close=False)
-                    break
-                except TransportClosed:
-                    break
+                    while True:
+
+                        # Wait the next answer from the websocket server
+                        answer = await receive()
+
+                        # Parse the answer
+                        answer_type, answer_id, execution_result = parse_answer(answer)
+
+                        await handle_answer(answer_type, answer_id, execution_result)
 
-                # Parse the answer
-                try:
-                    answer_type, answer_id, execution_result = self._parse_answer(
-                        answer
-                    )
                 except TransportQueryError as e:
                     # Received an exception for a specific query
                     # ==> Add an exception to this query queue
@@ -318,22 +556,25 @@ class WebsocketsTransportBase(AsyncTransport):
                     assert isinstance(
                         e.query_id, int
                     ), "TransportQueryError should have a query_id defined here"
-                    try:
-                        await self.listeners[e.query_id].set_exception(e)
-                    except KeyError:
-                        # Do nothing if no one is listening to this query_id
-                        pass
+                    listener = self.listeners.get(e.query_id)
 
-                    continue
+                    # Do nothing if no one is listening to this query_id
+                    if listener is not None:
+                        await listener.set_exception(e)
 
-                except (TransportServerError, TransportProtocolError) as e:
+                except TransportClosed:
+                    return
+
+                except (
+                    ConnectionClosed,
+                    TransportProtocolError,
+                    TransportServerError,
+                ) as e:
                     # Received a global exception for this transport
                     # ==> close the transport
                     # The exception will be raised for all current queries.
                     await self._fail(e, clean_close=False)
-                    break
-
-                await self._handle_answer(answer_type, answer_id, execution_result)
+                    return
 
         finally:
             log.debug("Exiting _receive_data_loop()")
@@ -345,20 +586,63 @@ class WebsocketsTransportBase(AsyncTransport):
         execution_result: Optional[ExecutionResult],
     ) -> None:
 
-        try:
-            # Put the answer in the queue
-            if answer_id is not None:
-                await self.listeners[answer_id].put((answer_type, execution_result))
-        except KeyError:
+        # Put the answer in the queue
+        if answer_id is not None:
+            listener = self.listeners.get(answer_id)
+
             # Do nothing if no one is listening to this query_id.
-            pass
+            if listener is not None:
+                if execution_result is not None:
+                    listener.put_nowait(execution_result)
+                elif answer_type == "complete":
+                    listener.put_nowait(_COMPLETE)
+
+    def _register_listener(self, query_id: int, send_stop: bool) -> ListenerQueue:
+        """Create and register the listener queue receiving the answers for
+        the provided query_id.
+
+        The listener is returned so that the consumer can keep a direct
+        reference to it and read the answers without a dict lookup; the
+        listeners dict stays in place for the receive task, which has to
+        dispatch by the id found on the wire.
+        """
+
+        # We will need to wait at close for this query to clean properly.
+        # The event is only cleared on the empty to non-empty transition,
+        # to avoid the wakeup bookkeeping of a redundant clear per query
+        if not self.listeners:
+            self._no_more_listeners.clear()
+
+        pool = self._listener_pool
+        if pool:
+            listener = pool.pop()
+            listener.reset(query_id, send_stop)
+        else:
+            listener = ListenerQueue(query_id, send_stop=send_stop)
+
+        self.listeners[query_id] = listener
+
+        return listener
+
+    def _register_single_result_listener(self, query_id: int) -> SingleResultListener:
+        """Create and register the single-shot listener receiving the answer
+        for the provided query_id. Used by execute instead of a full
+        ListenerQueue."""
+
+        if not self.listeners:
+            self._no_more_listeners.clear()
+
+        listener = SingleResultListener(query_id)
+        self.listeners[query_id] = listener
+
+        return listener
 
     async def subscribe(
         self,
         document: DocumentNode,
         variable_values: Optional[Dict[str, Any]] = None,
         operation_name: Optional[str] = None,
-        send_stop: Optional[bool] = True,
+        send_stop: bool = True,
     ) -> AsyncGenerator[ExecutionResult, None]:
         """Send a query and receive the results using a python async generator.
 
@@ -367,49 +651,192 @@ class WebsocketsTransportBase(AsyncTransport):
         The results are sent as an ExecutionResult object.
         """
 
+        if self.enable_subscription_sharing:
+            async for execution_result in self._shared_subscribe(
+                document, variable_values, operation_name, send_stop
+            ):
+                yield execution_result
+            return
+
         # Send the query and receive the id
         query_id: int = await self._send_query(
             document, variable_values, operation_name
         )
 
         # Create a queue to receive the answers for this query_id
-        listener = ListenerQueue(query_id, send_stop=(send_stop is True))
-        self.listeners[query_id] = listener
-
-        # We will need to wait at close for this query to clean properly
-        self._no_more_listeners.clear()
+        listener = self._register_listener(query_id, send_stop=bool(send_stop))
 
         try:
-            # Loop over the received answers
-            while True:
+            # Loop over the received answers, the iteration ends without
+            # error once the server sent the 'complete' answer.
+            # This can raise a TransportError or ConnectionClosed exception.
+            async for execution_result in listener:
+                yield execution_result
 
-                # Wait for the answer from the queue of this query_id
-                # This can raise a TransportError or ConnectionClosed exception.
-                answer_type, execution_result = await listener.get()
-
-                # If the received answer contains data,
-                # Then we will yield the results back as an ExecutionResult object
-                if execution_result is not None:
-                    yield execution_result
-
-                # If we receive a 'complete' answer from the server,
-                # Then we will end this async generator output without errors
-                elif answer_type == "complete":
-                    log.debug(
-                        f"Complete received for query {query_id} --> exit without error"
-                    )
-                    break
+            log.debug(
+                "Complete received for query %s --> exit without error", query_id
+            )
 
         except (asyncio.CancelledError, GeneratorExit) as e:
-            log.debug(f"Exception in subscribe: {e!r}")
+            log.debug("Exception in subscribe: %r", e)
             if listener.send_stop:
-                await self._stop_listener(query_id)
                 listener.send_stop = False
 
+                # Shield the stop send so that a second cancellation
+                # arriving while we await it does not lose the stop frame:
+                # the server would otherwise keep the subscription running.
+                try:
+                    await asyncio.shield(self._stop_listener(query_id))
+                except asyncio.CancelledError:
+                    pass
+
         finally:
-            log.debug(f"In subscribe finally for query_id {query_id}")
+            log.debug("In subscribe finally for query_id %s", query_id)
             self._remove_listener(query_id)
 
+    def _shared_subscription_key(
+        self,
+        document: DocumentNode,
+        variable_values: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> Tuple[str, Optional[str], Optional[str]]:
+        """Return the key identifying a subscription for de-duplication.
+
+        The variable values are serialized with sorted keys so that two
+        dicts with the same content always map to the same subscription.
+        """
+
+        variables_key = (
+            json.dumps(variable_values, sort_keys=True)
+            if variable_values is not None
+            else None
+        )
+
+        return (self._get_query_str(document), variables_key, operation_name)
+
+    async def _shared_subscribe(
+        self,
+        document: DocumentNode,
+        variable_values: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+        send_stop: bool,
+    ) -> AsyncGenerator[ExecutionResult, None]:
+        """Subscribe through a shared wire subscription.
+
+        The first consumer of a given (document, variable_values,
+        operation_name) starts the wire subscription and its broadcast
+        task; later consumers only register a local queue. The wire
+        subscription is stopped when the last consumer leaves.
+        """
+
+        key = self._shared_subscription_key(document, variable_values, operation_name)
+
+        shared = self._shared_subscriptions.get(key)
+
+        if shared is None:
+            log.debug("Starting shared subscription for key %r", key)
+            shared = _SharedSubscription()
+            self._shared_subscriptions[key] = shared
+            shared.task = self._loop.create_task(
+                self._shared_subscription_coro(
+                    key, shared, document, variable_values, operation_name, send_stop
+                )
+            )
+
+        consumer = ListenerQueue(query_id=0, send_stop=False)
+        shared.consumers.append(consumer)
+
+        try:
+            async for execution_result in consumer:
+                yield execution_result
+
+        except (asyncio.CancelledError, GeneratorExit) as e:
+            log.debug("Exception in shared subscribe: %r", e)
+
+        finally:
+            try:
+                shared.consumers.remove(consumer)
+            except ValueError:
+                pass
+
+            # The last consumer leaving cancels the broadcast task,
+            # which sends the stop message to the server.
+            task = shared.task
+            if not shared.consumers and task is not None and not task.done():
+
+                # Unregister the key before cancelling: the broadcast task
+                # awaits the shielded stop-frame send while unwinding, and a
+                # consumer joining in that window must start a fresh wire
+                # subscription instead of joining this dead one.
+                if self._shared_subscriptions.get(key) is shared:
+                    del self._shared_subscriptions[key]
+
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+    async def _shared_subscription_coro(
+        self,
+        key: Tuple[str, Optional[str], Optional[str]],
+        shared: _SharedSubscription,
+        document: DocumentNode,
+        variable_values: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+        send_stop: bool,
+    ) -> None:
+        """Broadcast task of a shared subscription.
+
+        Runs the single wire subscription and copies every answer to the
+        queues of all the current consumers.
+        """
+
+        try:
+            query_id = await self._send_query(
+                document, variable_values, operation_name
+            )
+
+            listener = self._register_listener(query_id, send_stop=bool(send_stop))
+
+            try:
+                async for item in listener:
+                    for consumer in shared.consumers:
+                        consumer.put_nowait(item)
+
+            except asyncio.CancelledError:
+                if listener.send_stop:
+                    listener.send_stop = False
+
+                    # Shielded for the same reason as in subscribe
+                    try:
+                        await asyncio.shield(self._stop_listener(query_id))
+                    except asyncio.CancelledError:
+                        pass
+                raise
+
+            finally:
+                self._remove_listener(query_id)
+
+            for consumer in shared.consumers:
+                consumer.put_nowait(_COMPLETE)
+
+        except asyncio.CancelledError:
+            # Defensive: a consumer which managed to join while we were
+            # being cancelled must not wait forever on a dead subscription
+            for consumer in shared.consumers:
+                consumer.put_nowait(_COMPLETE)
+            raise
+
+        except Exception as e:
+            # Transport or query error: raise it to all the consumers
+            for consumer in shared.consumers:
+                consumer.put_nowait(e)
+
+        finally:
+            if self._shared_subscriptions.get(key) is shared:
+                del self._shared_subscriptions[key]
+
     async def execute(
         self,
         document: DocumentNode,
@@ -419,31 +846,38 @@ class WebsocketsTransportBase(AsyncTransport):
         """Execute the provided document AST against the configured remote server
         using the current session.
 
-        Send a query but close the async generator as soon as we have the first answer.
+        Send a query and return the first answer received from the server.
+
+        This is a plain coroutine instead of a wrapper around subscribe so
+        that a single-shot query does not pay for the async generator frame
+        and its aclose machinery.
 
         The result is sent as an ExecutionResult object.
         """
-        first_result = None
 
-        generator = self.subscribe(
-            document, variable_values, operation_name, send_stop=False
+        # Send the query and receive the id
+        query_id: int = await self._send_query(
+            document, variable_values, operation_name
         )
 
-        async for result in generator:
-            first_result = result
+        # Create a single-shot listener to receive the answer for this query_id
+        listener = self._register_single_result_listener(query_id)
 
-            # Note: we need to run generator.aclose() here or the finally block in
-            # the subscribe will not be reached in pypy3 (python version 3.6.1)
-            await generator.aclose()
+        try:
+            # Wait for the answer resolved by the receive task
+            # This can raise a TransportError or ConnectionClosed exception.
+            execution_result = await listener.get()
 
-            break
+        finally:
+            log.debug("In execute finally for query_id %s", query_id)
+            self._remove_listener(query_id)
 
-        if first_result is None:
+        if execution_result is None:
             raise TransportQueryError(
                 "Query completed without any answer received from the server"
             )
 
-        return first_result
+        return execution_result
 
     async def connect(self) -> None:
         """Coroutine which will:
@@ -465,6 +899,10 @@ class WebsocketsTransportBase(AsyncTransport):
             # to connect twice using the same client at the same time
             self._connecting = True
 
+            # Pin the running event loop once; spawning tasks through it
+            # avoids the event loop lookup done by asyncio.ensure_future
+            self._loop = asyncio.get_running_loop()
+
             # If the ssl parameter is not provided,
             # generate the ssl value depending on the url
             ssl: Optional[Union[SSLContext, bool]]
@@ -522,12 +960,13 @@ class WebsocketsTransportBase(AsyncTransport):
             # If specified, create a task to check liveness of the connection
             # through keep-alive messages
             if self.keep_alive_timeout is not None:
-                self.check_keep_alive_task = asyncio.ensure_future(
+                self._last_keep_alive = time.monotonic()
+                self.check_keep_alive_task = self._loop.create_task(
                     self._check_ws_liveness()
                 )
 
             # Create a task to listen to the incoming websocket messages
-            self.receive_data_task = asyncio.ensure_future(self._receive_data_loop())
+            self.receive_data_task = self._loop.create_task(self._receive_data_loop())
 
         else:
             raise TransportAlreadyConnected("Transport is already connected")
@@ -538,11 +977,18 @@ class WebsocketsTransportBase(AsyncTransport):
         """After exiting from a subscription, remove the listener and
         signal an event if this was the last listener for the client.
         """
-        if query_id in self.listeners:
-            del self.listeners[query_id]
+        listener = self.listeners.pop(query_id, None)
+
+        # Keep the instance for reuse; it is only ever pooled here, once
+        # its consumer is done with it.
+        if (
+            isinstance(listener, ListenerQueue)
+            and len(self._listener_pool) < _LISTENER_POOL_SIZE
+        ):
+            self._listener_pool.append(listener)
 
         remaining = len(self.listeners)
-        log.debug(f"listener {query_id} deleted, {remaining} remaining")
+        log.debug("listener %s deleted, %s remaining", query_id, remaining)
 
         if remaining == 0:
             self._no_more_listeners.set()
@@ -555,12 +1001,19 @@ class WebsocketsTransportBase(AsyncTransport):
         """
 
         # Send 'stop' message for all current queries
+        # The sends are gathered so that the frames are written back-to-back
+        # on the connection instead of paying one event loop round-trip per query
+        stop_coros = []
+
         for query_id, listener in self.listeners.items():
 
             if listener.send_stop:
-                await self._stop_listener(query_id)
+                stop_coros.append(self._stop_listener(query_id))
                 listener.send_stop = False
 
+        if stop_coros:
+            await asyncio.gather(*stop_coros)
+
         # Wait that there is no more listeners (we received 'complete' for all queries)
         try:
             await asyncio.wait_for(self._no_more_listeners.wait(), self.close_timeout)
@@ -643,7 +1096,7 @@ class WebsocketsTransportBase(AsyncTransport):
                 log.debug("_fail started with self.websocket == None -> already closed")
             else:
                 self.close_task = asyncio.shield(
-                    asyncio.ensure_future(self._close_coro(e, clean_close=clean_close))
+                    self._loop.create_task(self._close_coro(e, clean_close=clean_close))
                 )
         else:
             log.debug(
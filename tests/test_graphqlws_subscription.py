@@ -432,7 +432,8 @@ async def test_graphqlws_subscription_with_operation_name(
     assert count == -1
 
     # Check that the query contains the operationName
-    assert '"operationName": "CountdownSubscription"' in logged_messages[0]
+    first_message = json.loads(logged_messages[0])
+    assert first_message["payload"]["operationName"] == "CountdownSubscription"
 
 
 @pytest.mark.asyncio
@@ -114,6 +114,56 @@ async def server_countdown(ws, path):
         await ws.wait_closed()
 
 
+async def server_countdown_multiplex(ws, path):
+    """Countdown server handling several start messages on one connection."""
+    import websockets
+
+    logged_messages.clear()
+
+    counting_tasks = {}
+
+    async def counting_coro(query_id, count):
+        for number in range(count, -1, -1):
+            await ws.send(
+                countdown_server_answer.format(query_id=query_id, number=number)
+            )
+            await asyncio.sleep(2 * MS)
+        await WebSocketServerHelper.send_complete(ws, query_id)
+
+    try:
+        await WebSocketServerHelper.send_connection_ack(ws)
+
+        while True:
+
+            try:
+                result = await ws.recv()
+            except websockets.exceptions.ConnectionClosed:
+                break
+
+            logged_messages.append(result)
+            json_result = json.loads(result)
+
+            if json_result["type"] == "start":
+                query_id = json_result["id"]
+                count_found = search("count: {:d}", json_result["payload"]["query"])
+                counting_tasks[query_id] = asyncio.ensure_future(
+                    counting_coro(query_id, count_found[0])
+                )
+
+            elif json_result["type"] == "stop":
+                counting_task = counting_tasks.pop(json_result["id"], None)
+                if counting_task is not None:
+                    counting_task.cancel()
+
+            elif json_result["type"] == "connection_terminate":
+                break
+
+    finally:
+        for counting_task in counting_tasks.values():
+            counting_task.cancel()
+        await ws.wait_closed()
+
+
 countdown_subscription_str = """
     subscription {{
       countdown (count: {count}) {{
@@ -144,6 +194,89 @@ async def test_websocket_subscription(event_loop, client_and_server, subscriptio
     assert count == -1
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("server", [server_countdown], indirect=True)
+@pytest.mark.parametrize("subscription_str", [countdown_subscription_str])
+async def test_websocket_subscription_shared(
+    event_loop, client_and_server, subscription_str
+):
+
+    session, server = client_and_server
+
+    session.transport.enable_subscription_sharing = True
+
+    count = 10
+    subscription = gql(subscription_str.format(count=count))
+
+    async def consumer_coro():
+        received = []
+
+        async for result in session.subscribe(subscription):
+
+            number = result["number"]
+            print(f"Number received: {number}")
+
+            received.append(number)
+
+        return received
+
+    received1, received2 = await asyncio.gather(consumer_coro(), consumer_coro())
+
+    expected = list(range(count, -1, -1))
+    assert received1 == expected
+    assert received2 == expected
+
+    # Check that the two consumers shared a single wire subscription
+    start_messages = [m for m in logged_messages if json.loads(m)["type"] == "start"]
+    assert len(start_messages) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("server", [server_countdown_multiplex], indirect=True)
+@pytest.mark.parametrize("subscription_str", [countdown_subscription_str])
+async def test_websocket_subscription_shared_resubscribe(
+    event_loop, client_and_server, subscription_str
+):
+
+    session, server = client_and_server
+
+    session.transport.enable_subscription_sharing = True
+
+    count = 10
+    subscription = gql(subscription_str.format(count=count))
+
+    async def consumer_coro():
+        received = []
+
+        async for result in session.subscribe(subscription):
+            received.append(result["number"])
+
+        return received
+
+    # Cancel the first consumer while it is waiting for answers
+    first_task = asyncio.ensure_future(consumer_coro())
+    await asyncio.sleep(3 * MS)
+    first_task.cancel()
+
+    # Let the cancellation unwind just enough to reach the window where
+    # the broadcast task is still awaiting the shielded stop-frame send
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    # A consumer joining now must start a fresh wire subscription
+    # instead of being appended to the dying one
+    received = await asyncio.wait_for(consumer_coro(), timeout=60)
+    assert received == list(range(count, -1, -1))
+
+    try:
+        await first_task
+    except asyncio.CancelledError:
+        pass
+
+    start_messages = [m for m in logged_messages if json.loads(m)["type"] == "start"]
+    assert len(start_messages) == 2
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("server", [server_countdown], indirect=True)
 @pytest.mark.parametrize("subscription_str", [countdown_subscription_str])
@@ -378,7 +511,8 @@ async def test_websocket_subscription_with_operation_name(
     assert count == -1
 
     # Check that the query contains the operationName
-    assert '"operationName": "CountdownSubscription"' in logged_messages[0]
+    first_message = json.loads(logged_messages[0])
+    assert first_message["payload"]["operationName"] == "CountdownSubscription"
 
 
 WITH_KEEPALIVE = True
@@ -610,7 +744,7 @@ def test_websocket_subscription_sync_graceful_shutdown(server, subscription_str)
     interrupt_task.exception()
 
     # Check that the server received a connection_terminate message last
-    assert logged_messages.pop() == '{"type": "connection_terminate"}'
+    assert json.loads(logged_messages.pop()) == {"type": "connection_terminate"}
 
 
 @pytest.mark.asyncio